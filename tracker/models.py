@@ -7,13 +7,29 @@ from django.db import models
 from django_celery_beat.models import IntervalSchedule, PeriodicTask
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from shared.models import AbstractModel
 from tracker.choices import Roles
-from tracker.values import ROLE_MAX_CHARACTER_LENGTH, DefaultModelValues
-
-
+from tracker.values import (
+    REPOSITORY_LINK_TIMEOUT,
+    ROLE_MAX_CHARACTER_LENGTH,
+    DefaultModelValues,
+)
+
+# Shared session for repository link checks, keeping connections alive between calls.
+link_session = requests.Session()
+link_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
 
 
 class CustomUserManager(BaseUserManager):
@@ -186,7 +202,7 @@ class Repository(AbstractModel):
             raise ValidationError("Repository author must be in the link.")
 
         try:
-            response = requests.get(str(self.link))
+            response = link_session.get(str(self.link), timeout=REPOSITORY_LINK_TIMEOUT)
             response.raise_for_status()
 
             if not response.ok:
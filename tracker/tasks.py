@@ -2,8 +2,8 @@ from asgiref.sync import async_to_sync
 from celery import shared_task
 
 from .models import TelegramUser
-from .telegram.bot import send_revision_messages
-from .utils import get_user_revisions
+from .telegram.bot import bot, send_revision_messages
+from .utils import close_session, get_user_revisions
 
 
 @shared_task
@@ -15,11 +15,25 @@ def fetch_approvals(telegram_id: str) -> None:
     :params telegram_id: The telegram id of the user
     :returns None
     """
+    async_to_sync(notify_user_revisions)(telegram_id)
 
-    telegram_user = TelegramUser.objects.filter(telegram_id=telegram_id).first()
+
+async def notify_user_revisions(telegram_id: str) -> None:
+    """
+    Collects the user revisions and sends them to the user in a single event loop,
+    closing the sessions bound to that loop afterwards.
+
+    :params telegram_id: The telegram id of the user
+    :returns None
+    """
+    telegram_user = await TelegramUser.objects.filter(telegram_id=telegram_id).afirst()
     if not telegram_user:
         return
 
-    reviews = get_user_revisions(str(telegram_user.telegram_id))
-    if reviews:
-        async_to_sync(send_revision_messages)(telegram_user.telegram_id, reviews)
+    try:
+        reviews = await get_user_revisions(str(telegram_user.telegram_id))
+        if reviews:
+            await send_revision_messages(telegram_user.telegram_id, reviews)
+    finally:
+        await close_session()
+        await bot.session.close()
@@ -12,10 +12,13 @@ from aiogram.utils.keyboard import ReplyKeyboardBuilder, ReplyKeyboardMarkup
 from dotenv import load_dotenv
 from tracker import ISSUES_URL, PULLS_URL, get_issues_without_pull_requests
 from tracker.telegram.templates import TEMPLATES
+from tracker.values import TELEGRAM_MESSAGE_LIMIT
 from tracker.utils import (
+    close_session,
     create_telegram_user,
     get_all_available_issues,
     get_all_repostitories,
+    get_contributor_issues,
     get_user,
     attach_link_to_issue,
 )
@@ -32,6 +35,9 @@ bot = Bot(
 )
 dp = Dispatcher()
 
+# Room left for the message body once it is wrapped in a blockquote.
+BLOCKQUOTE_MESSAGE_LIMIT = TELEGRAM_MESSAGE_LIMIT - len("<blockquote></blockquote>")
+
 
 @dp.message(CommandStart(deep_link=True, deep_link_encoded=True))
 async def auth_link_handler(message: Message, command: CommandObject) -> None:
@@ -52,7 +58,7 @@ async def auth_link_handler(message: Message, command: CommandObject) -> None:
     )
     await message.answer(
         message_text,
-        reply_markup=main_button_markup(),
+        reply_markup=MAIN_BUTTON_MARKUP,
     )
 
 
@@ -68,7 +74,7 @@ async def start_message(message: Message) -> None:
     )
     await message.answer(
         message_text,
-        reply_markup=main_button_markup(),
+        reply_markup=MAIN_BUTTON_MARKUP,
     )
 
 
@@ -81,39 +87,79 @@ async def send_deprecated_issue_assignees(msg: Message) -> None:
     """
     all_repositories = await get_all_repostitories(msg.from_user.id)
 
-    for repository in all_repositories:
+    repositories_parts = await asyncio.gather(
+        *(get_deprecated_issues_message(repository) for repository in all_repositories)
+    )
 
-        repo_message = TEMPLATES.repo_header.substitute(
-            author=repository.get("author", "Unknown"),
-            repo=repository.get("name", "Unknown"),
-        )
+    for parts in repositories_parts:
+        for message in split_message(parts, limit=BLOCKQUOTE_MESSAGE_LIMIT):
+            await msg.reply(f"<blockquote>{message}</blockquote>")
 
-        issues = get_issues_without_pull_requests(
-            issues_url=ISSUES_URL.format(
-                owner=repository.get("author", str()),
-                repo=repository.get("name", str()),
-            ),
-            pull_requests_url=PULLS_URL.format(
-                owner=repository.get("author", str()),
-                repo=repository.get("name", str()),
-            ),
+
+async def get_deprecated_issues_message(repository: dict) -> list[str]:
+    """
+    Builds the missed deadlines message fragments for a single repository.
+    :param repository: Repository values dictionary
+    :return: list[str]
+    """
+    author = repository.get("author") or ""
+    name = repository.get("name") or ""
+
+    repo_message = TEMPLATES.repo_header.substitute(
+        author=author or "Unknown",
+        repo=name or "Unknown",
+    )
+
+    issues = await get_issues_without_pull_requests(
+        issues_url=ISSUES_URL.format(owner=author, repo=name),
+        pull_requests_url=PULLS_URL.format(owner=author, repo=name),
+    )
+
+    parts = [repo_message]
+    parts.extend(
+        TEMPLATES.issue_detail.substitute(
+            title=issue.get("title", "No title"),
+            user=issue.get("assignee", {}).get("login", "Unassigned"),
+            days=issue.get("days", "N/A"),
         )
+        for issue in issues
+    )
 
-        issue_messages = ""
-        for issue in issues:
-            issue_messages += TEMPLATES.issue_detail.substitute(
-                title=issue.get("title", "No title"),
-                user=issue.get("assignee", {}).get("login", "Unassigned"),
-                days=issue.get("days", "N/A"),
+    if not issues:
+        parts.append(TEMPLATES.no_missed_deadlines.template)
 
-            )
+    return parts
 
-        if not issues:
-            issue_messages = TEMPLATES.no_missed_deadlines.template
 
-        message = repo_message + issue_messages
+def split_message(parts: list[str], limit: int = TELEGRAM_MESSAGE_LIMIT) -> list[str]:
+    """
+    Joins message fragments into as few messages as fit the Telegram length limit.
+    Fragments are kept whole unless a single fragment is longer than the limit.
+
+    :param parts: The message fragments in order.
+    :param limit: The maximum length of a single message.
+    :return: list[str]
+    """
+    messages = []
+    current = []
+    length = 0
 
-        await msg.reply(f"<blockquote>{message}</blockquote>")
+    for part in parts:
+        for start in range(0, len(part), limit):
+            chunk = part[start : start + limit]
+
+            if current and length + len(chunk) > limit:
+                messages.append("".join(current))
+                current = []
+                length = 0
+
+            current.append(chunk)
+            length += len(chunk)
+
+    if current:
+        messages.append("".join(current))
+
+    return messages
 
 
 def escape_html(text: str) -> str:
@@ -137,32 +183,31 @@ async def send_available_issues(msg: Message) -> None:
     all_repositories = await get_all_repostitories(msg.from_user.id)
 
     for repository in all_repositories:
+        author = repository.get("author") or ""
+        name = repository.get("name") or ""
+
         repo_message = TEMPLATES.repo_header.substitute(
-            author=repository.get("author", "Unknown"),
-            repo=repository.get("name", "Unknown"),
+            author=author or "Unknown",
+            repo=name or "Unknown",
         )
 
-        issues = get_all_available_issues(
-            ISSUES_URL.format(
-                owner=repository.get("author", str()),
-                repo=repository.get("name", str()),
-            ),
+        issues = await get_all_available_issues(
+            ISSUES_URL.format(owner=author, repo=name),
         )
 
-
-        issue_messages = ""
-        for issue in issues:
-            issue_messages += TEMPLATES.issue_summary.substitute(
+        parts = [repo_message]
+        parts.extend(
+            TEMPLATES.issue_summary.substitute(
                 title=issue.get("title", "No title provided")
-
             )
+            for issue in issues
+        )
 
         if not issues:
-            issue_messages = TEMPLATES.no_issues.template
-
-        message = repo_message + issue_messages
+            parts.append(TEMPLATES.no_issues.template)
 
-        await msg.reply(message, parse_mode="HTML")
+        for message in split_message(parts):
+            await msg.reply(message, parse_mode="HTML")
 
 @dp.message(F.text.contains("/issues "))
 async def get_contributor_tasks(message: Message):
@@ -170,15 +215,12 @@ async def get_contributor_tasks(message: Message):
 
     regex = r"ODHack"
 
-    issues = get_user_issues(username, True, True, regex)
+    issues = await get_contributor_issues(username, True, True, regex)
 
-    msg = "ODHack Issues assigned: \n"
-
-    if len(issues) > 0:
-        for issue in issues:
-            msg += TEMPLATES.issue_list_item.substitute(
-                issue=issue,
-            )
+    if issues:
+        msg = "ODHack Issues assigned: \n" + "".join(
+            TEMPLATES.issue_list_item.substitute(issue=issue) for issue in issues
+        )
     else:
         msg = TEMPLATES.no_issues.template
     await message.reply(msg)
@@ -190,11 +232,9 @@ async def send_revision_messages(telegram_id: str, reviews_data: list[dict]) ->
     :params tele_id: The telegram user id of the user to send to
     :reviews_data: A list of all the reviews data for all pull requests associated to the user repos
     """
-    message = (
-        "=" * 50 + "\n" + "<b>Revisions and Approvals</b>" + "\n" + "=" * 50 + "\n\n"
-    )
+    parts = [TEMPLATES.revisions_header.template]
     for data in reviews_data:
-        message += (
+        parts.append(
             "-------------------------------"
             f"Repo: <b>{data['repo']}</b>"
             "\n"
@@ -203,14 +243,15 @@ async def send_revision_messages(telegram_id: str, reviews_data: list[dict]) ->
             f"<b>Reviews:</b>"
             "\n"
         )
-        for review in data["reviews"]:
-            message += (
-                f"User: <b>{review['user']['login']}</b>"
-                "\n"
-                f"State: {review['state']}"
-                "\n\n"
-            )
-        message += "-------------------------------"
+        parts.extend(
+            f"User: <b>{review['user']['login']}</b>"
+            "\n"
+            f"State: {review['state']}"
+            "\n\n"
+            for review in data["reviews"]
+        )
+        parts.append("-------------------------------")
+    message = "".join(parts)
     # Send bot message
     await bot.send_message(telegram_id, message)
 
@@ -227,6 +268,10 @@ def main_button_markup() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
+# The keyboard never changes, so it is built once and shared by all handlers.
+MAIN_BUTTON_MARKUP = main_button_markup()
+
+
 async def create_tg_link(uuid) -> str:
     return await create_start_link(bot=bot, payload=uuid, encode=True)
 
@@ -240,6 +285,7 @@ async def start_tg_bot() -> None:
         await dp.start_polling(bot, polling_timeout=0)
 
     finally:
+        await close_session()
         await bot.session.close()
 
 
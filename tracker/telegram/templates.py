@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from string import Template
 
+SEPARATOR = "=" * 50
+
 
 @dataclass
 class TemplateNames:
@@ -13,12 +15,13 @@ class TemplateNames:
     issue_summary: Template
     no_issues: Template
     issue_list_item: Template
+    revisions_header: Template
 
 
 TEMPLATES = TemplateNames(
     greeting=Template("Hello $user_mention!\nWould you like to check some issues?"),
     repo_header=Template(
-        "=" * 50 + "\n<b>Repository: $author/$repo</b>\n" + "=" * 50 + "\n\n"
+        f"{SEPARATOR}\n<b>Repository: $author/$repo</b>\n{SEPARATOR}\n\n"
     ),
     issue_detail=Template(
         "-----------------------------------\n"
@@ -40,5 +43,7 @@ TEMPLATES = TemplateNames(
         "$issue\n"
         "-----------------------------------\n"
     ),
-
+    revisions_header=Template(
+        f"{SEPARATOR}\n<b>Revisions and Approvals</b>\n{SEPARATOR}\n\n"
+    ),
 )
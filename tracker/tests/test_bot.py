@@ -0,0 +1,25 @@
+import django
+
+django.setup()
+
+from django.test import SimpleTestCase
+
+from tracker.telegram.bot import split_message
+
+
+class TestSplitMessage(SimpleTestCase):
+    def test_keeps_fragments_whole_within_limit(self):
+        """Test fragments are grouped into messages no longer than the limit."""
+        parts = ["header\n"] + [f"issue {number:02d}\n" for number in range(10)]
+
+        messages = split_message(parts, limit=30)
+
+        self.assertEqual("".join(messages), "".join(parts))
+        self.assertTrue(all(len(message) <= 30 for message in messages))
+        self.assertEqual(messages[0], "header\nissue 00\nissue 01\n")
+
+    def test_cuts_fragment_longer_than_limit(self):
+        """Test a single oversized fragment is cut into several messages."""
+        messages = split_message(["x" * 25], limit=10)
+
+        self.assertEqual(messages, ["x" * 10, "x" * 10, "x" * 5])
@@ -2,13 +2,29 @@ import django
 
 django.setup()
 
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from asgiref.sync import async_to_sync
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from faker import Faker
 
+from tracker import utils
 from tracker.choices import Roles
 from tracker.models import CustomUser, Repository, TelegramUser
-from tracker.utils import get_all_repostitories, get_user
+from tracker.utils import (
+    check_issue_assignment_events,
+    close_session,
+    create_telegram_user,
+    get_all_repostitories,
+    get_issues_without_pull_requests,
+    get_json_page,
+    get_user,
+    iter_json_pages,
+    parse_github_datetime,
+)
 
 fake = Faker()
 
@@ -61,4 +77,264 @@ class TestGetUser(TestCase):
         """Test retrieving user with invalid UUID raises exception."""
         invalid_uuid = "00000000-0000-0000-0000-000000000000"
         with self.assertRaises(CustomUser.DoesNotExist):
-            async_to_sync(get_user)(uuid=invalid_uuid)
\ No newline at end of file
+            async_to_sync(get_user)(uuid=invalid_uuid)
+
+
+class TestCreateTelegramUser(TestCase):
+    def test_links_user_created_by_signal(self):
+        """Test linking replaces the placeholder TelegramUser created by the signal."""
+        custom_user = CustomUser.objects.create_user(
+            email=fake.email(), password=fake.password()
+        )
+        telegram_id = str(fake.random_int(min=100000000, max=9999999999))
+
+        async_to_sync(create_telegram_user)(user=custom_user, telegram_id=telegram_id)
+
+        telegram_users = TelegramUser.objects.filter(user=custom_user)
+        self.assertEqual(telegram_users.count(), 1)
+        self.assertEqual(telegram_users.get().telegram_id, telegram_id)
+
+
+class TestGetAllRepositoriesByTelegramId(TestCase):
+    def setUp(self):
+        """Link a signal-created user to a telegram id and give it repositories."""
+        self.custom_user = CustomUser.objects.create_user(
+            email=fake.email(), password=fake.password()
+        )
+        self.telegram_id = str(fake.random_int(min=100000000, max=9999999999))
+        async_to_sync(create_telegram_user)(
+            user=self.custom_user, telegram_id=self.telegram_id
+        )
+
+        Repository.objects.create(user=self.custom_user, name="TestRepo1")
+        Repository.objects.create(user=self.custom_user, name="TestRepo2")
+        Repository.objects.create(
+            user=CustomUser.objects.create_user(email=fake.email()), name="OtherRepo"
+        )
+
+    def test_returns_linked_user_repositories(self):
+        """Test the repositories of the linked user are returned."""
+        result = async_to_sync(get_all_repostitories)(tele_id=self.telegram_id)
+        self.assertEqual(
+            sorted(repository["name"] for repository in result),
+            ["TestRepo1", "TestRepo2"],
+        )
+
+    def test_unknown_telegram_id_returns_empty_list(self):
+        """Test an unknown telegram id returns no repositories."""
+        result = async_to_sync(get_all_repostitories)(tele_id="987654321")
+        self.assertEqual(result, [])
+
+
+class TestParseGithubDatetime(SimpleTestCase):
+    def test_parse_github_datetime(self):
+        """Test parsing a GitHub timestamp into an aware UTC datetime."""
+        result = parse_github_datetime("2024-11-05T09:08:07Z")
+        self.assertEqual(result, datetime(2024, 11, 5, 9, 8, 7, tzinfo=timezone.utc))
+
+
+class GithubServerTestCase(SimpleTestCase):
+    """Serves stubbed GitHub API responses from a local aiohttp server."""
+
+    def setUp(self):
+        """Reset the response caches and the recorded requests."""
+        utils._fresh_responses.clear()
+        utils._validated_responses.clear()
+        self.requests = []
+
+    @asynccontextmanager
+    async def github_server(self, routes: dict):
+        """
+        Starts a server answering each path in `routes` with its handler
+        and records every request it receives.
+        """
+
+        async def handler(request: web.Request) -> web.Response:
+            self.requests.append(request)
+            return routes[request.path](request)
+
+        app = web.Application()
+        app.router.add_get("/{path:.*}", handler)
+
+        async with TestServer(app) as server:
+            try:
+                yield server
+            finally:
+                await close_session()
+
+
+class TestGetJsonPage(GithubServerTestCase):
+    last_modified = "Tue, 05 Nov 2024 09:08:07 GMT"
+
+    def respond(self, request: web.Request) -> web.Response:
+        """Answers with an ETag, or 304 when the client sends it back."""
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response([{"id": 1}], headers={"ETag": '"v1"'})
+
+    def respond_last_modified(self, request: web.Request) -> web.Response:
+        """Answers with Last-Modified only, or 304 when the client sends it back."""
+        if request.headers.get("If-Modified-Since") == self.last_modified:
+            return web.Response(status=304)
+        return web.json_response(
+            [{"id": 1}], headers={"Last-Modified": self.last_modified}
+        )
+
+    async def test_fresh_response_is_served_from_cache(self):
+        """Test a cached response is returned without a second request."""
+        async with self.github_server({"/items": self.respond}) as server:
+            url = str(server.make_url("/items"))
+
+            first, _ = await get_json_page(url)
+            second, _ = await get_json_page(url)
+
+        self.assertEqual(first, [{"id": 1}])
+        self.assertIs(second, first)
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_expired_response_is_revalidated_by_etag(self):
+        """Test an expired response sends If-None-Match and reuses the body on 304."""
+        async with self.github_server({"/items": self.respond}) as server:
+            url = str(server.make_url("/items"))
+
+            first, _ = await get_json_page(url)
+            utils._fresh_responses.clear()
+            second, _ = await get_json_page(url)
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[1].headers.get("If-None-Match"), '"v1"')
+        self.assertEqual(second, first)
+
+    async def test_expired_response_is_revalidated_by_last_modified(self):
+        """Test an expired response sends If-Modified-Since and reuses the body on 304."""
+        async with self.github_server({"/items": self.respond_last_modified}) as server:
+            url = str(server.make_url("/items"))
+
+            first, _ = await get_json_page(url)
+            utils._fresh_responses.clear()
+            second, _ = await get_json_page(url)
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(
+            self.requests[1].headers.get("If-Modified-Since"), self.last_modified
+        )
+        self.assertNotIn("If-None-Match", self.requests[1].headers)
+        self.assertEqual(second, first)
+
+
+class TestIterJsonPages(GithubServerTestCase):
+    async def test_follows_next_links(self):
+        """Test every page is read and the params are only sent with the first one."""
+
+        def respond(request: web.Request) -> web.Response:
+            if request.query.get("page") == "2":
+                return web.json_response([{"id": 3}])
+            next_url = request.url.with_query(page=2)
+            return web.json_response(
+                [{"id": 1}, {"id": 2}], headers={"Link": f'<{next_url}>; rel="next"'}
+            )
+
+        async with self.github_server({"/items": respond}) as server:
+            items = [
+                item
+                async for item in iter_json_pages(
+                    str(server.make_url("/items")), params={"per_page": 2}
+                )
+            ]
+
+        self.assertEqual(items, [{"id": 1}, {"id": 2}, {"id": 3}])
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[0].query.get("per_page"), "2")
+        self.assertEqual(dict(self.requests[1].query), {"page": "2"})
+
+
+class TestCheckIssueAssignmentEvents(GithubServerTestCase):
+    async def test_latest_assignment_wins(self):
+        """Test the most recent assigned event is returned."""
+        events = [
+            {
+                "event": "assigned",
+                "assignee": {"login": "first"},
+                "created_at": "2024-11-01T00:00:00Z",
+            },
+            {
+                "event": "assigned",
+                "assignee": {"login": "second"},
+                "created_at": "2024-11-03T00:00:00Z",
+            },
+            {"event": "labeled", "created_at": "2024-11-04T00:00:00Z"},
+        ]
+
+        async with self.github_server(
+            {"/events": lambda request: web.json_response(events)}
+        ) as server:
+            result = await check_issue_assignment_events(
+                {"events_url": str(server.make_url("/events"))}
+            )
+
+        self.assertEqual(
+            result, {"assignee": "second", "assigned_at": "2024-11-03T00:00:00Z"}
+        )
+
+
+class TestGetIssuesWithoutPullRequests(GithubServerTestCase):
+    @staticmethod
+    def days_ago(days: int) -> str:
+        """Formats a timestamp the given number of days in the past like GitHub does."""
+        return (datetime.now(timezone.utc) - timedelta(days=days)).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
+
+    async def test_skips_events_for_open_pr_authors_and_new_issues(self):
+        """Test issues with an open PR or created today are dropped without events requests."""
+        issues = []
+
+        def respond_issues(request: web.Request) -> web.Response:
+            return web.json_response(issues)
+
+        def respond_events(request: web.Request) -> web.Response:
+            return web.json_response(
+                [
+                    {
+                        "event": "assigned",
+                        "assignee": {"login": "carol"},
+                        "created_at": self.days_ago(5),
+                    }
+                ]
+            )
+
+        async with self.github_server(
+            {
+                "/issues": respond_issues,
+                "/pulls": lambda request: web.json_response(
+                    [{"user": {"login": "alice"}}]
+                ),
+                "/events/carol": respond_events,
+            }
+        ) as server:
+            for login, created_days_ago in (("alice", 10), ("bob", 0), ("carol", 10)):
+                issues.append(
+                    {
+                        "title": f"Issue of {login}",
+                        "state": "open",
+                        "assignee": {"login": login},
+                        "created_at": self.days_ago(created_days_ago),
+                        "events_url": str(server.make_url(f"/events/{login}")),
+                    }
+                )
+
+            result = await get_issues_without_pull_requests(
+                issues_url=str(server.make_url("/issues")),
+                pull_requests_url=str(server.make_url("/pulls")),
+            )
+
+        self.assertEqual([issue["title"] for issue in result], ["Issue of carol"])
+        self.assertEqual(result[0]["days"], 5)
+        self.assertEqual(
+            sorted(request.path for request in self.requests),
+            ["/events/carol", "/issues", "/pulls"],
+        )
+        # The issues held by the response cache are left untouched.
+        for page, _ in utils._fresh_responses.values():
+            for item in page:
+                self.assertNotIn("days", item)
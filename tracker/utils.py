@@ -1,39 +1,218 @@
+import asyncio
 import logging
-from collections import defaultdict
+import re
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
-import requests
-from asgiref.sync import async_to_sync, sync_to_async
-from dateutil.relativedelta import relativedelta
-
-from .values import HEADERS, PULLS_REVIEWS_URL, PULLS_URL
+import aiohttp
+import orjson
+from cachetools import TTLCache
+
+from .values import (
+    ASSIGNED_ISSUES_PARAMS,
+    GITHUB_CACHE_MAXSIZE,
+    GITHUB_CACHE_TTL,
+    GITHUB_CONNECTION_LIMIT,
+    GITHUB_CONNECTION_LIMIT_PER_HOST,
+    GITHUB_DNS_CACHE_TTL,
+    GITHUB_KEEPALIVE_TIMEOUT,
+    GITHUB_MAX_CONCURRENT_REQUESTS,
+    GITHUB_PAGE_SIZE,
+    GITHUB_REQUEST_TIMEOUT,
+    GITHUB_REVALIDATION_CACHE_TTL,
+    HEADERS,
+    ISSUES_SEARCH,
+    OPEN_ISSUES_PARAMS,
+    OPEN_PULLS_PARAMS,
+    PULLS_REVIEWS_URL,
+    PULLS_URL,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Failed, timed out and undecodable responses are all handled as a failed request.
+GITHUB_REQUEST_ERRORS = (
+    aiohttp.ClientError,
+    asyncio.TimeoutError,
+    orjson.JSONDecodeError,
+)
+
+_session: aiohttp.ClientSession | None = None
+_semaphore: asyncio.Semaphore | None = None
+
+# Fresh responses are served without a request; stale ones are revalidated
+# with their ETag and Last-Modified headers.
+_fresh_responses = TTLCache(maxsize=GITHUB_CACHE_MAXSIZE, ttl=GITHUB_CACHE_TTL)
+_validated_responses = TTLCache(
+    maxsize=GITHUB_CACHE_MAXSIZE, ttl=GITHUB_REVALIDATION_CACHE_TTL
+)
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Returns the shared GitHub client session, creating it on first use.
+    The session keeps a bounded pool of connections alive, so it must be created
+    and closed inside the same running event loop.
+
+    :return: aiohttp.ClientSession
+    """
+    global _session, _semaphore
+
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=GITHUB_REQUEST_TIMEOUT),
+            connector=aiohttp.TCPConnector(
+                limit=GITHUB_CONNECTION_LIMIT,
+                limit_per_host=GITHUB_CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=GITHUB_DNS_CACHE_TTL,
+                keepalive_timeout=GITHUB_KEEPALIVE_TIMEOUT,
+            ),
+        )
+        _semaphore = asyncio.Semaphore(GITHUB_MAX_CONCURRENT_REQUESTS)
+
+    return _session
+
+
+async def close_session() -> None:
+    """
+    Closes the shared GitHub client session if it is open.
+    :return: None
+    """
+    global _session, _semaphore
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+
+    _session = None
+    _semaphore = None
 
-@sync_to_async
-def get_all_repostitories(tele_id: str) -> list[dict]:
+
+async def get_json_page(
+    url: str, params: dict | None = None
+) -> tuple[list | dict, str | None]:
+    """
+    Sends a GET request to the GitHub API and decodes the JSON response.
+    Responses are cached for a short time, after which the stored ETag and
+    Last-Modified values are sent so an unchanged resource is answered with 304
+    at no rate-limit cost.
+    Raises one of GITHUB_REQUEST_ERRORS if the request fails.
+
+    :param url: The API endpoint.
+    :param params: Optional query parameters.
+    :return: The decoded JSON body and the URL of the next page, if any.
+    """
+    key = (url, frozenset((params or {}).items()))
+
+    cached = _fresh_responses.get(key)
+    if cached is not None:
+        return cached
+
+    headers = {}
+    etag, last_modified, page = _validated_responses.get(key, (None, None, None))
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    session = get_session()
+
+    async with _semaphore, session.get(url, params=params, headers=headers) as response:
+        if response.status == 304:
+            _fresh_responses[key] = page
+            return page
+
+        response.raise_for_status()
+
+        next_link = response.links.get("next", {}).get("url")
+        page = (
+            orjson.loads(await response.read()),
+            str(next_link) if next_link else None,
+        )
+
+        _fresh_responses[key] = page
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _validated_responses[key] = (etag, last_modified, page)
+
+        return page
+
+
+async def fetch_json(url: str, params: dict | None = None) -> list | dict:
+    """
+    Returns the decoded JSON body of a single GitHub API response.
+    Raises one of GITHUB_REQUEST_ERRORS if the request fails.
+
+    :param url: The API endpoint.
+    :param params: Optional query parameters.
+    :return: The decoded JSON body.
+    """
+    body, _ = await get_json_page(url, params)
+    return body
+
+
+async def iter_json_pages(url: str, params: dict | None = None) -> AsyncIterator[dict]:
+    """
+    Yields every item of a paginated GitHub API list, following the
+    `Link: rel="next"` header until the last page.
+    Raises one of GITHUB_REQUEST_ERRORS if a request fails.
+
+    :param url: The API endpoint.
+    :param params: Optional query parameters for the first page.
+    :return: An async iterator over the list items.
+    """
+    while url:
+        page, url = await get_json_page(url, params)
+        # The next page link already carries the original query string.
+        params = None
+
+        for item in page:
+            yield item
+
+
+def parse_github_datetime(value: str) -> datetime:
+    """
+    Parses a GitHub `YYYY-MM-DDTHH:MM:SSZ` timestamp into an aware UTC datetime.
+    Slicing the fixed-width string is much cheaper than `datetime.strptime`.
+
+    :param value: The timestamp string.
+    :return: datetime
+    """
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        tzinfo=timezone.utc,
+    )
+
+
+async def get_all_repostitories(tele_id: str) -> list[dict]:
     """
     A function that returns a list of repositories asynchronously.
-    Handles cases where the TelegramUser does not exist.
+    Returns an empty list when the TelegramUser does not exist.
 
     :param tele_id: str
     :return: List of repositories
     """
-    from .models import TelegramUser
+    from .models import Repository
 
-    try:
-        repositories = TelegramUser.objects.get(
-            telegram_id=tele_id
-        ).user.repository_set.values()
-        return list(repositories)
-    except TelegramUser.DoesNotExist:
-        return []
+    return [
+        repository
+        async for repository in Repository.objects.filter(
+            user__telegramuser__telegram_id=tele_id
+        )
+        .values()
+        .aiterator()
+    ]
 
 
-@sync_to_async
-def get_user(uuid: str) -> tuple["CustomUser"]:
+async def get_user(uuid: str) -> tuple["CustomUser"]:
     """
     Retunrs an user instantce
     :param uuid: str
@@ -41,26 +220,26 @@ def get_user(uuid: str) -> tuple["CustomUser"]:
     """
     from .models import CustomUser
 
-    user = CustomUser.objects.get(id=uuid)
+    user = await CustomUser.objects.aget(id=uuid)
 
     return (user,)
 
 
-@sync_to_async
-def create_telegram_user(user: object, telegram_id: str) -> None:
+async def create_telegram_user(user: object, telegram_id: str) -> None:
     """
-    Creates a new TelegramUser object
+    Creates or updates the TelegramUser object of a user
     :param user: CustomUser object
     :param telegram_id: telegram id
     :return: None
     """
     from .models import TelegramUser
 
-    if not TelegramUser.objects.filter(telegram_id=telegram_id, user=user).exists():
-        TelegramUser.objects.create(user=user, telegram_id=telegram_id)
+    await TelegramUser.objects.aupdate_or_create(
+        user=user, defaults={"telegram_id": telegram_id}
+    )
 
 
-def check_issue_assignment_events(issue: dict) -> dict:
+async def check_issue_assignment_events(issue: dict) -> dict:
     """
     Checks an issue's timeline for assignment events to determine if it was
     newly assigned or reassigned to a different contributor.
@@ -76,82 +255,82 @@ def check_issue_assignment_events(issue: dict) -> dict:
     try:
         events_url = issue.get("events_url", str())
 
-        response = requests.get(events_url, headers=HEADERS)
-        response.raise_for_status()
-
-        events = response.json()
-
-        assignment_info = defaultdict(str)
+        events = [
+            event
+            async for event in iter_json_pages(
+                events_url, params={"per_page": GITHUB_PAGE_SIZE}
+            )
+        ]
 
-        for event in events:
+        # Events are returned oldest first, so the latest assignment is the first match.
+        for event in reversed(events):
             if event.get("event") == "assigned":
-                assignment_info["assignee"] = event.get("assignee", {}).get("login", "")
-                assignment_info["assigned_at"] = event.get("created_at", "")
+                return {
+                    "assignee": (event.get("assignee") or {}).get("login", ""),
+                    "assigned_at": event.get("created_at", ""),
+                }
 
-        return dict(assignment_info)
-
-    except requests.exceptions.RequestException as e:
+    except GITHUB_REQUEST_ERRORS as e:
         logger.info(e)
     return {}
 
 
-def get_all_open_and_assigned_issues(url: str) -> list[dict]:
+async def iter_open_assigned_issues(url: str) -> AsyncIterator[dict]:
     """
-    Retrieves all open and assigned issues from a given URL.
-    This function makes a GET request to the provided URL to fetch issues data,
-    and filters the results to return only open and assigned issues.
-    If the request fails, an empty list will be returned.
+    Yields all open and assigned issues from a given URL.
+    This function walks every page of the provided URL asking GitHub for open,
+    assigned issues only, and skips pull requests and drafts.
+    If a request fails, the iteration stops.
 
     :param url: The API endpoint for issues.
-    :return: A list of dictionaries representing open and assigned issues.
+    :return: An async iterator over open and assigned issues.
     """
     try:
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-
-        issues = response.json()
-
-        open_assigned_issues = list(
-            filter(
-                lambda issue: issue.get("state") == "open"
+        async for issue in iter_json_pages(url, params=ASSIGNED_ISSUES_PARAMS):
+            if (
+                issue.get("state") == "open"
                 and issue.get("assignee")
                 and not issue.get("draft")
-                and not issue.get("pull_request"),
-                issues,
-            )
-        )
-
-        return open_assigned_issues
+                and not issue.get("pull_request")
+            ):
+                yield issue
 
-    except requests.exceptions.RequestException as e:
+    except GITHUB_REQUEST_ERRORS as e:
         logger.info(e)
-    return []
 
 
-def get_all_open_pull_requests(url: str) -> list[dict]:
+async def get_all_open_and_assigned_issues(url: str) -> list[dict]:
+    """
+    Collects all open and assigned issues from a given URL into a list.
+
+    :param url: The API endpoint for issues.
+    :return: A list of dictionaries representing open and assigned issues.
+    """
+    return [issue async for issue in iter_open_assigned_issues(url)]
+
+
+async def get_all_open_pull_requests(url: str) -> list[dict]:
     """
     Retrieves all open pull requests from a given URL.
-    This function sends a GET request to the specified URL with the `state=open` parameter
-    to retrieve open pull requests. If the request is successful, it returns the response
-    as a list of dictionaries. If the request fails, an empty list is returned.
+    This function walks every page of the specified URL with the `state=open` parameter
+    to retrieve open pull requests. If the requests are successful, it returns them
+    as a list of dictionaries. If a request fails, an empty list is returned.
 
     :param url: The API endpoint for pull requests.
     :return: A list of dictionaries representing open pull requests.
     """
     try:
-        response = requests.get(url, headers=HEADERS, params={"state": "open"})
-        response.raise_for_status()
-
-        response = response.json()
-
-        return response
+        return [
+            pull_request
+            async for pull_request in iter_json_pages(url, params=OPEN_PULLS_PARAMS)
+        ]
 
-    except requests.exceptions.RequestException as e:
+    except GITHUB_REQUEST_ERRORS as e:
         logger.info(e)
     return []
 
 
-def get_issues_without_pull_requests(
+async def get_issues_without_pull_requests(
     issues_url: str, pull_requests_url: str
 ) -> list[dict]:
     """
@@ -161,44 +340,47 @@ def get_issues_without_pull_requests(
     :param pull_requests_url: The API endpoint for pull requests.
     :return: List of issues with matched PR details if found.
     """
-    issues = get_all_open_and_assigned_issues(issues_url)
-
-    for issue in issues:
-        issue["assignment_info"] = check_issue_assignment_events(issue)
-        assigned_at = issue.get("assignment_info", dict()).get("assigned_at")
-
-        time_delta = (
-            relativedelta(
-                dt1=datetime.now(),
-                dt2=datetime.strptime(assigned_at, "%Y-%m-%dT%H:%M:%SZ"),
-            )
-            if assigned_at
-            else str()
-        )
-
-        issue["days"] = time_delta.days if time_delta else 0
+    now = datetime.now(timezone.utc)
 
-    pull_requests = get_all_open_pull_requests(pull_requests_url)
+    issues, pull_requests = await asyncio.gather(
+        get_all_open_and_assigned_issues(issues_url),
+        get_all_open_pull_requests(pull_requests_url),
+    )
 
-    pull_requests_users = [
-        pull_request.get("user", dict()).get("login")
+    pull_requests_users = {
+        pull_request["user"]["login"]
         for pull_request in pull_requests
-        if pull_request.get("user", dict()).get("login")
+        if pull_request.get("user")
+    }
+
+    # Assignment events are only needed for issues whose assignee has no open PR.
+    # An issue cannot have been assigned before it was created, so issues opened
+    # less than a day ago can never have missed the deadline.
+    issues = [
+        issue
+        for issue in issues
+        if issue.get("assignee", dict()).get("login") not in pull_requests_users
+        and (now - parse_github_datetime(issue.get("created_at"))).days >= 1
     ]
 
+    assignments = await asyncio.gather(
+        *(check_issue_assignment_events(issue) for issue in issues)
+    )
+
     result = list()
 
-    for issue in issues.copy():
-        if (
-            issue.get("days", 0) >= 1
-            and issue.get("assignee", dict()).get("login") not in pull_requests_users
-        ):
-            result.append(issue)
+    for issue, assignment_info in zip(issues, assignments):
+        assigned_at = assignment_info.get("assigned_at")
+        days = (now - parse_github_datetime(assigned_at)).days if assigned_at else 0
+
+        if days >= 1:
+            # Issue dicts are shared with the response cache, so they are not mutated.
+            result.append({**issue, "assignment_info": assignment_info, "days": days})
 
     return result
 
 
-def get_all_available_issues(url: str) -> list[dict]:
+async def get_all_available_issues(url: str) -> list[dict]:
     """
     Retrieves all available issues from a given URL.
     If the response status is not successful, it raises an exception and returns an empty list.
@@ -207,78 +389,82 @@ def get_all_available_issues(url: str) -> list[dict]:
     :return: A list of dictionaries representing available issues or an empty list if an error occurs.
     """
     try:
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-
-        issues = response.json()
-
-        available_issues = list(
-            filter(
-                lambda issue: issue.get("state") == "open"
-                and not any(
-                    [
-                        issue.get("assignee"),
-                        issue.get("draft"),
-                        issue.get("pull_request"),
-                    ]
-                ),
-                issues,
+        available_issues = [
+            issue
+            async for issue in iter_json_pages(url, params=OPEN_ISSUES_PARAMS)
+            if issue.get("state") == "open"
+            and not any(
+                [
+                    issue.get("assignee"),
+                    issue.get("draft"),
+                    issue.get("pull_request"),
+                ]
             )
-        )
-        logger.info(available_issues)
+        ]
+        logger.info("Found %d available issues at %s", len(available_issues), url)
         return available_issues
 
-    except requests.exceptions.RequestException as e:
+    except GITHUB_REQUEST_ERRORS as e:
         logger.info(e)
     return []
 
 
-def get_pull_reviews(url: str) -> list[dict]:
+async def get_pull_reviews(url: str) -> list[dict]:
     """
     Retrieves all reviews for a pull request.
     :param url: The API endpoint for pull request review.
     :return: A list of dictionaries representing available issues.
     """
     try:
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-
-        if response.ok:
-            return response.json()
-    except requests.exceptions.RequestException as e:
+        return await fetch_json(url)
+    except GITHUB_REQUEST_ERRORS as e:
         logger.info(e)
     return []
 
 
-def get_user_revisions(telegram_id: str) -> list[dict]:
+async def get_repository_revisions(repo: dict) -> list[dict]:
     """
-    Retrieve all the reviews of a user repositories open PRs
-    :params tele_id: The TelegramUser id of the user
-    :return: A list of reviews for all the user repos open PRS
+    Retrieve the reviews of all open PRs of a single repository
+    :params repo: Repository values dictionary
+    :return: A list of reviews for the repository open PRs
     """
-    repos = async_to_sync(get_all_repostitories)(telegram_id)
-    reviews_list = []
-    for repo in repos:
-        pulls = get_all_open_pull_requests(
-            PULLS_URL.format(owner=repo.get("author", ""), repo=repo.get("name", ""))
-        )
-        return_data = {"repo": repo.get("name", "")}
-        for pull in pulls:
-            return_data["pull"] = pull.get("title", "")  # add the pull title
-            reviews_data = get_pull_reviews(
+    author = repo.get("author", "")
+    name = repo.get("name", "")
+
+    pulls = await get_all_open_pull_requests(PULLS_URL.format(owner=author, repo=name))
+    reviews = await asyncio.gather(
+        *(
+            get_pull_reviews(
                 url=PULLS_REVIEWS_URL.format(
-                    owner=repo.get("author", ""),
-                    repo=repo.get("name", ""),
-                    pull_number=pull["number"],
+                    owner=author, repo=name, pull_number=pull["number"]
                 )
             )
-            if reviews_data:
-                return_data["reviews"] = reviews_data
-                reviews_list.append(return_data.copy())
-    return reviews_list
+            for pull in pulls
+        )
+    )
+
+    return [
+        {"repo": name, "pull": pull.get("title", ""), "reviews": reviews_data}
+        for pull, reviews_data in zip(pulls, reviews)
+        if reviews_data
+    ]
 
 
-def get_contributor_issues(
+async def get_user_revisions(telegram_id: str) -> list[dict]:
+    """
+    Retrieve all the reviews of a user repositories open PRs
+    :params tele_id: The TelegramUser id of the user
+    :return: A list of reviews for all the user repos open PRS
+    """
+    repos = await get_all_repostitories(telegram_id)
+    repos_reviews = await asyncio.gather(
+        *(get_repository_revisions(repo) for repo in repos)
+    )
+
+    return [review for repo_reviews in repos_reviews for review in repo_reviews]
+
+
+async def get_contributor_issues(
     username: str, is_state_open: bool, match_label: bool = False, regex: str = ""
 ) -> list:
     """
@@ -286,14 +472,14 @@ def get_contributor_issues(
     :param username: The username of the github account.
     :return: A list representing issues assigned.
     """
+    pattern = re.compile(regex, re.IGNORECASE) if match_label else None
+
     try:
         api_url = ISSUES_SEARCH.format(username=username)
 
-        response = requests.get(api_url, headers=HEADERS)
-
-        response.raise_for_status()
+        response = await fetch_json(api_url)
 
-        issues = response.json().get("items", [])
+        issues = response.get("items", [])
         issues_format = []
         for issue in issues:
 
@@ -301,16 +487,16 @@ def get_contributor_issues(
                 continue
 
             labels = [label.get("name") for label in issue.get("labels", [])]
-            for label in labels:
-                if not match_label or re.search(regex, label, re.IGNORECASE):
-                    issues_format.append(
-                        f"Issue: {issue.get('title')}: {issue.get('html_url')}"
-                    )
-                    break
+            if labels and (
+                pattern is None or any(pattern.search(label) for label in labels)
+            ):
+                issues_format.append(
+                    f"Issue: {issue.get('title')}: {issue.get('html_url')}"
+                )
 
         return issues_format
 
-    except requests.exceptions.RequestException as e:
+    except GITHUB_REQUEST_ERRORS as e:
         logger.info(e)
     return []
 
@@ -327,7 +513,7 @@ def attach_link_to_issue(issue_title: str, issue_link: str) -> str:
     return title
 
 
-def get_time_before_deadline(issue: dict) -> str:
+async def get_time_before_deadline(issue: dict) -> str:
     """
     Returns the time remaining before the deadline of an assigned issue.
     If the issue has no assignee or deadline, returns appropriate messages.
@@ -336,7 +522,7 @@ def get_time_before_deadline(issue: dict) -> str:
     :return: Time remaining in a human-readable format.
     """
 
-    assignment_info = check_issue_assignment_events(issue)
+    assignment_info = await check_issue_assignment_events(issue)
     assigned_at = assignment_info.get("assigned_at")
 
     if not assigned_at:
@@ -346,19 +532,14 @@ def get_time_before_deadline(issue: dict) -> str:
     if not deadline_str:
         return "No deadline set for this issue."
 
-    deadline_datetime = datetime.strptime(deadline_str, "%Y-%m-%dT%H:%M:%SZ").replace(
-        tzinfo=timezone.utc
-    )
+    deadline_datetime = parse_github_datetime(deadline_str)
     now = datetime.now(timezone.utc)
 
     time_left = deadline_datetime - now
 
     if assigned_at:
-        assigned_time = datetime.strptime(assigned_at, "%Y-%m-%dT%H:%M:%SZ").replace(
-            tzinfo=timezone.utc
-        )
-        time_delta = relativedelta(now, assigned_time)
-        issue["assigned_days"] = time_delta.days
+        assigned_time = parse_github_datetime(assigned_at)
+        issue["assigned_days"] = (now - assigned_time).days
     else:
         issue["assigned_days"] = 0
 
@@ -11,15 +11,40 @@ PULLS_REVIEWS_URL = (
     "https://api.github.com/repos/{owner}/{repo}/pulls/{pull_number}/reviews"
 )
 
+GITHUB_PAGE_SIZE = 100
+
+ASSIGNED_ISSUES_PARAMS = {
+    "state": "open",
+    "assignee": "*",
+    "sort": "updated",
+    "per_page": GITHUB_PAGE_SIZE,
+}
+OPEN_ISSUES_PARAMS = {"state": "open", "per_page": GITHUB_PAGE_SIZE}
+OPEN_PULLS_PARAMS = {"state": "open", "per_page": GITHUB_PAGE_SIZE}
+
 ROLE_MAX_CHARACTER_LENGTH = 11
+TELEGRAM_MESSAGE_LIMIT = 4096
+REPOSITORY_LINK_TIMEOUT = 10
 ISSUES_SEARCH = "https://api.github.com/search/issues?q=assignee:{username}+is:issue"
 
 HEADERS = {
     "Accept": "application/vnd.github+json",
+    "Accept-Encoding": "gzip, deflate",
     "Authorization": f'Bearer {os.environ.get("GITHUB_AUTH_TOKEN", "")}',
     "X-GitHub-Api-Version": "2022-11-28",
 }
 
+GITHUB_CACHE_MAXSIZE = 1024
+GITHUB_CACHE_TTL = 60
+GITHUB_REVALIDATION_CACHE_TTL = 3600
+
+GITHUB_CONNECTION_LIMIT = 100
+GITHUB_CONNECTION_LIMIT_PER_HOST = 10
+GITHUB_DNS_CACHE_TTL = 300
+GITHUB_KEEPALIVE_TIMEOUT = 60
+GITHUB_MAX_CONCURRENT_REQUESTS = 10
+GITHUB_REQUEST_TIMEOUT = 30
+
 
 @dataclass(frozen=True)
 class DefaultModelValues: